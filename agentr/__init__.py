@@ -1,9 +1,29 @@
 """AgentR - AI Research Assistant Framework"""
 
-__version__ = "0.1.0"
+from importlib import import_module
 
-from .agent import AgentR
-from .client import OpenAIClient
-from .config import EnvConfig
+__version__ = "0.1.0"
 
 __all__ = ["AgentR", "OpenAIClient", "EnvConfig"]
+
+_LAZY_IMPORTS = {
+    "AgentR": ".agent",
+    "OpenAIClient": ".client",
+    "EnvConfig": ".config",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import public names so heavy dependencies load only when needed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily exported names alongside module attributes."""
+    return sorted([*globals(), *__all__])
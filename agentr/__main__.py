@@ -0,0 +1,361 @@
+import asyncio
+import atexit
+import os
+import sys
+import time
+from contextlib import nullcontext
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from rich.console import Console
+from rich.live import Live
+from rich.markdown import Markdown
+from rich.markup import escape
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.prompt import Confirm, Prompt
+from rich.spinner import Spinner
+from rich.table import Table
+from rich.text import Text
+
+from agentr.exceptions import AgentRError
+
+if TYPE_CHECKING:
+    from agentr import AgentR, EnvConfig
+
+
+app = typer.Typer(help="AgentR - AI Research Assistant", add_completion=False)
+console = Console()
+
+HISTORY_FILE = os.path.expanduser("~/.agentr_history")
+CHAT_COMMANDS = ("/help", "/info", "/clear", "exit", "quit")
+EXIT_COMMANDS = frozenset({"exit", "quit"})
+STREAM_RENDER_INTERVAL = 0.1
+
+# Static panels are built once and re-rendered on every /help or /clear.
+COMMANDS_PANEL = Panel(
+    """[bold cyan]Commands:[/bold cyan]
+
+• [green]/help[/green]  - Show this message
+• [green]/info[/green]  - Session info
+• [green]/clear[/green] - Clear screen
+• [green]exit[/green]   - Exit chat""",
+    title="[bold yellow]💡 Help[/bold yellow]",
+    border_style="yellow",
+)
+WELCOME_PANEL = Panel(
+    """[bold cyan]Welcome to AgentR![/bold cyan]
+
+Your AI Research Assistant with conversation memory.
+
+Ask me anything!""",
+    title="[bold green]🤖 AgentR Chat[/bold green]",
+    border_style="green",
+)
+RESPONSE_TITLE = Text.from_markup("[bold cyan]AgentR[/bold cyan]")
+
+
+def load_settings(env_file: str | None = None) -> "EnvConfig":
+    """Load cached settings, optionally from a specific env file."""
+    from agentr.config import get_settings
+
+    return get_settings(_env_file=env_file) if env_file else get_settings()
+
+
+@lru_cache(maxsize=4)
+def init_agent(
+    tracing: bool = False, thread_id: str = "default", env_file: str | None = None
+) -> "AgentR":
+    """Initialize AgentR instance, reused for the same settings within a process."""
+    from agentr import AgentR, OpenAIClient
+
+    config = load_settings(env_file)
+    client = OpenAIClient(client_config=config)
+    agent = AgentR(client, config, tracing=tracing, thread_id=thread_id, enable_memory=True)
+    return agent
+
+
+def create_runner() -> asyncio.Runner:
+    """Create a reusable event loop runner, backed by uvloop when installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.Runner()
+    return asyncio.Runner(loop_factory=uvloop.new_event_loop)
+
+
+def create_spinner(description: str):
+    """Create a progress spinner, or a no-op context when output is not a terminal."""
+    if not console.is_terminal:
+        return nullcontext()
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+    progress.add_task(description=description, total=None)
+    return progress
+
+
+def response_panel(response: str, markdown: bool = True) -> Panel:
+    """Build the panel an agent response is rendered in."""
+    body = Markdown(response) if markdown else response
+    return Panel(body, title=RESPONSE_TITLE, border_style="cyan")
+
+
+def display_response(response: str, markdown: bool = True):
+    """Display agent response."""
+    if not console.is_terminal:
+        console.out(response, highlight=False)
+        return
+
+    console.print(response_panel(response, markdown))
+
+
+async def stream_response(agent: "AgentR", query: str) -> str:
+    """Render the agent's answer live as it streams and return the full text."""
+    parts: list[str] = []
+    last_render = 0.0
+    with Live(Spinner("dots", text="Thinking..."), console=console, refresh_per_second=8) as live:
+        async for delta in agent.astream_response(request=query):
+            parts.append(delta)
+            # Markdown is re-parsed on every update, so throttle re-renders.
+            now = time.perf_counter()
+            if now - last_render >= STREAM_RENDER_INTERVAL:
+                live.update(response_panel("".join(parts)))
+                last_render = now
+        live.update(response_panel("".join(parts)))
+    return "".join(parts)
+
+
+def setup_readline():
+    """Enable line editing, tab completion and persistent input history."""
+    try:
+        import readline
+    except ImportError:
+        return
+
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+
+    def complete(text: str, state: int) -> str | None:
+        matches = [cmd for cmd in CHAT_COMMANDS if cmd.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+
+
+def show_commands():
+    """Display available commands."""
+    console.print(COMMANDS_PANEL)
+
+
+def show_welcome():
+    """Display welcome banner."""
+    console.print(WELCOME_PANEL)
+
+
+def show_banner():
+    """Display welcome banner and commands in a single write."""
+    with console:
+        show_welcome()
+        console.print()
+        show_commands()
+
+
+def clear_screen():
+    """Clear the terminal and redraw the banner."""
+    console.clear()
+    show_banner()
+
+
+def show_info(agent: "AgentR", tracing: bool, query_count: int):
+    """Display session info."""
+    table = Table(title="Session Info", show_header=True, header_style="bold cyan")
+    table.add_column("Setting", style="green")
+    table.add_column("Value")
+    table.add_row("Model", agent.client.model)
+    table.add_row("Thread ID", agent.thread_id)
+    table.add_row("Tracing", "✓ Enabled" if tracing else "✗ Disabled")
+    table.add_row("Queries", str(query_count))
+    console.print(table)
+
+
+def run_piped(agent: "AgentR", runner: asyncio.Runner):
+    """Answer queries read line by line from non-interactive stdin."""
+    for line in sys.stdin:
+        query = line.strip()
+        if not query:
+            continue
+        if query.lower() in EXIT_COMMANDS:
+            break
+
+        try:
+            display_response(runner.run(agent.ainvoke(request=query)))
+        except AgentRError as e:
+            console.print(f"[red]Error: {e}[/red]")
+
+
+@app.command()
+def chat(
+    tracing: bool = typer.Option(False, "--trace", "-t", help="Enable tracing"),
+    thread_id: str = typer.Option("default", "--thread", help="Thread ID"),
+    env_file: str | None = typer.Option(None, "--env-file", help="Load settings from file"),
+):
+    """Start interactive chat."""
+    with create_runner() as runner:
+        if sys.stdin.isatty():
+            run_interactive(runner, tracing, thread_id, env_file)
+        else:
+            run_piped(init_agent(tracing, thread_id, env_file), runner)
+
+
+def run_interactive(
+    runner: asyncio.Runner, tracing: bool, thread_id: str, env_file: str | None = None
+):
+    """Run the interactive chat loop."""
+    setup_readline()
+    show_banner()
+
+    agent = init_agent(tracing, thread_id, env_file)
+    query_count = 0
+
+    def info_command():
+        show_info(agent, tracing, query_count)
+
+    commands = {
+        "/help": show_commands,
+        "help": show_commands,
+        "/info": info_command,
+        "info": info_command,
+        "/clear": clear_screen,
+        "clear": clear_screen,
+    }
+
+    while True:
+        try:
+            user_input = Prompt.ask("\n[bold green]You[/bold green]")
+            command = user_input.strip().lower()
+
+            if not command:
+                continue
+
+            if command in EXIT_COMMANDS:
+                if Confirm.ask("\n[yellow]Exit?[/yellow]"):
+                    console.print("\n[cyan]Goodbye! 👋[/cyan]\n")
+                    break
+                continue
+
+            handler = commands.get(command)
+            if handler is not None:
+                handler()
+                continue
+
+            query_count += 1
+            start = time.perf_counter()
+
+            try:
+                console.print()
+                if console.is_terminal:
+                    runner.run(stream_response(agent, user_input))
+                else:
+                    display_response(runner.run(agent.ainvoke(request=user_input)))
+
+                duration = time.perf_counter() - start
+                console.print(f"[dim]Time: {duration:.2f}s[/dim]")
+            except AgentRError as e:
+                console.print(f"\n[red]Error: {e}[/red]")
+
+        except KeyboardInterrupt:
+            if Confirm.ask("\n\n[yellow]Exit?[/yellow]"):
+                console.print("\n[cyan]Goodbye! 👋[/cyan]\n")
+                break
+            continue
+        except EOFError:
+            console.print("\n[cyan]Goodbye! 👋[/cyan]\n")
+            break
+
+
+async def run_batch(
+    agent: "AgentR", queries: list[str], max_concurrency: int
+) -> list[str | BaseException]:
+    """Answer queries concurrently, each in its own thread, preserving input order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(index: int, query: str) -> str:
+        async with semaphore:
+            return await agent.ainvoke(request=query, thread_id=f"batch-{index}")
+
+    return await asyncio.gather(
+        *(run_one(i, query) for i, query in enumerate(queries, 1)), return_exceptions=True
+    )
+
+
+@app.command()
+def batch(
+    file: Annotated[
+        Path, typer.Argument(exists=True, dir_okay=False, help="File with one query per line")
+    ],
+    concurrency: int = typer.Option(4, "--concurrency", "-c", min=1, help="Queries run at once"),
+    tracing: bool = typer.Option(False, "--trace", "-t", help="Enable tracing"),
+    env_file: str | None = typer.Option(None, "--env-file", help="Load settings from file"),
+):
+    """Answer queries from a file concurrently."""
+    queries = [line.strip() for line in file.read_text().splitlines() if line.strip()]
+    if not queries:
+        console.print("[yellow]No queries found[/yellow]")
+        return
+
+    agent = init_agent(tracing, "batch", env_file)
+    start = time.perf_counter()
+    with create_runner() as runner, create_spinner(f"Running {len(queries)} queries..."):
+        results = runner.run(run_batch(agent, queries, concurrency))
+    duration = time.perf_counter() - start
+
+    for i, (query, result) in enumerate(zip(queries, results), 1):
+        console.print(f"\n[bold green]{i}. {escape(query)}[/bold green]")
+        if isinstance(result, BaseException):
+            console.print(f"[red]Error: {escape(str(result))}[/red]")
+        else:
+            display_response(result)
+    console.print(f"\n[dim]{len(queries)} queries in {duration:.2f}s[/dim]")
+
+
+@app.command()
+def info(
+    env_file: str | None = typer.Option(None, "--env-file", help="Load settings from file"),
+):
+    """Display config."""
+    config = load_settings(env_file)
+    table = Table(title="AgentR Config", show_header=True, header_style="bold cyan")
+    table.add_column("Setting", style="green")
+    table.add_column("Value")
+    table.add_row("Model", config.model_name)
+    table.add_row("API URL", config.api_url)
+    table.add_row("Environment", config.environment)
+    console.print(table)
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    ctx: typer.Context,
+    tracing: bool = typer.Option(False, "--trace", "-t"),
+    thread_id: str = typer.Option("default", "--thread"),
+    env_file: str | None = typer.Option(None, "--env-file"),
+):
+    """AgentR - AI Research Assistant"""
+    if ctx.invoked_subcommand is None:
+        chat(tracing=tracing, thread_id=thread_id, env_file=env_file)
+
+
+if __name__ == "__main__":
+    app()
@@ -1,22 +1,54 @@
+from __future__ import annotations
+
 import logging
-from langchain_core.runnables import RunnableConfig
-from langfuse import Langfuse
-from langfuse.langchain import CallbackHandler
-from langgraph.graph import END, START, StateGraph
-from langgraph.graph.state import CompiledStateGraph
-from langgraph.prebuilt import ToolNode
-from langgraph.checkpoint.memory import MemorySaver
-
-from .client import OpenAIClient
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
+
 from .config import EnvConfig, get_default_runtime_config
 from .exceptions import ResponseError
+from .graph_utils import extract_text_response
 from .nodes import OrchestratorNode, QueryProcessor, Researcher
 from .states import AgentState
-from .tools import ToolManager, ToolName
+from .tools import ToolName, create_search_tools
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.graph.state import CompiledStateGraph
+
+    from .client import OpenAIClient
 
 logger = logging.getLogger(__name__)
 
 
+class _AnswerBuffer:
+    """Hold orchestrator text back until its message turns out not to call a tool.
+
+    The model may write a preamble ("Let me look that up") before the research tool
+    call, and tool call chunks only arrive after that text.
+    """
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._is_tool_call = False
+
+    def add(self, data: tuple[Any, dict]):
+        """Buffer answer text from an orchestrator token chunk, ignoring other nodes."""
+        chunk, metadata = data
+        if metadata.get("langgraph_node") != "orchestrator":
+            return
+        if getattr(chunk, "tool_call_chunks", None) or getattr(chunk, "tool_calls", None):
+            self._is_tool_call = True
+        elif not self._is_tool_call:
+            self._parts.append(extract_text_response(chunk))
+
+    def flush(self) -> str:
+        """Get the buffered answer once its message is complete, and reset."""
+        answer = "" if self._is_tool_call else "".join(self._parts)
+        self._parts = []
+        self._is_tool_call = False
+        return answer
+
+
 class AgentR:
     """AI Research Assistant Agent with in-memory conversation history."""
 
@@ -30,8 +62,12 @@ class AgentR:
         enable_memory: bool = True,
     ):
         """Initialize AgentR with in-memory persistence."""
+        from langchain_core.runnables import RunnableConfig
+        from langgraph.checkpoint.memory import MemorySaver
+
         self.client = llm_client
-        self.researcher_tools = [ToolName.WEB_SEARCH]
+        self.researcher_tools = [ToolName.WEB_SEARCH, ToolName.BATCH_WEB_SEARCH]
+        self.tavily_api_key = env_config.tavily_api_key
         self.callbacks = []
         self.thread_id = thread_id
         self.enable_memory = enable_memory
@@ -58,6 +94,9 @@ class AgentR:
 
     def _setup_tracing(self, env_config: EnvConfig):
         """Setup Langfuse tracing."""
+        from langfuse import Langfuse
+        from langfuse.langchain import CallbackHandler
+
         lf_callback = CallbackHandler()
         lf_callback.client = Langfuse(
             public_key=env_config.langfuse_public_key,
@@ -81,72 +120,139 @@ class AgentR:
             researcher_history=[],
         )
 
-    def invoke(self, request: str) -> str:
-        """Execute agent on request and return response."""
-        initial_state = self._build_initial_state(request)
-        agent_response = self.graph.invoke(initial_state, self.config)
+    def _get_config(self, thread_id: str | None = None) -> RunnableConfig:
+        """Get runnable config, optionally targeting another conversation thread."""
+        if thread_id is None or thread_id == self.thread_id:
+            return self.config
 
+        return {
+            **self.config,
+            "configurable": {**self.config["configurable"], "thread_id": thread_id},
+        }
+
+    @staticmethod
+    def _extract_response(agent_response: dict) -> str:
+        """Extract final response from graph output."""
         literal_response = agent_response.get("response")
         if literal_response:
             return literal_response
         else:
             raise ResponseError("Agent execution completed but response is empty")
 
-    def stream(self, request: str):
+    def invoke(self, request: str, thread_id: str | None = None) -> str:
+        """Execute agent on request and return response."""
+        initial_state = self._build_initial_state(request)
+        agent_response = self.graph.invoke(initial_state, self._get_config(thread_id))
+        return self._extract_response(agent_response)
+
+    async def ainvoke(self, request: str, thread_id: str | None = None) -> str:
+        """Execute agent asynchronously, running parallel searches concurrently."""
+        initial_state = self._build_initial_state(request)
+        agent_response = await self.graph.ainvoke(initial_state, self._get_config(thread_id))
+        return self._extract_response(agent_response)
+
+    def stream(self, request: str, thread_id: str | None = None):
         """Stream agent execution with memory support."""
         initial_state = self._build_initial_state(request)
-        for event in self.graph.stream(initial_state, self.config):
+        for event in self.graph.stream(initial_state, self._get_config(thread_id)):
             yield event
 
-    def get_state(self) -> dict:
-        """Get current conversation state from memory."""
+    def stream_response(self, request: str, thread_id: str | None = None) -> Iterator[str]:
+        """Stream the final answer as text deltas while the agent runs."""
+        initial_state = self._build_initial_state(request)
+        final_state: dict = {}
+        answer = _AnswerBuffer()
+        streamed = False
+        for mode, data in self.graph.stream(
+            initial_state, self._get_config(thread_id), stream_mode=["messages", "values"]
+        ):
+            if mode == "messages":
+                answer.add(data)
+                continue
+            # A values update follows every node run, so the orchestrator message is done.
+            final_state = data
+            if delta := answer.flush():
+                streamed = True
+                yield delta
+
+        if not streamed:
+            yield self._extract_response(final_state)
+
+    async def astream_response(
+        self, request: str, thread_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """Stream the final answer as text deltas while the agent runs asynchronously."""
+        initial_state = self._build_initial_state(request)
+        final_state: dict = {}
+        answer = _AnswerBuffer()
+        streamed = False
+        async for mode, data in self.graph.astream(
+            initial_state, self._get_config(thread_id), stream_mode=["messages", "values"]
+        ):
+            if mode == "messages":
+                answer.add(data)
+                continue
+            final_state = data
+            if delta := answer.flush():
+                streamed = True
+                yield delta
+
+        if not streamed:
+            yield self._extract_response(final_state)
+
+    def get_state(self, thread_id: str | None = None) -> dict:
+        """Get conversation state from memory."""
         if not self.enable_memory or not self.memory_saver:
             return {}
 
         try:
-            config = {"configurable": {"thread_id": self.thread_id}}
+            config = {"configurable": {"thread_id": thread_id or self.thread_id}}
             state = self.memory_saver.get(config)
             return state.values if state else {}
         except Exception as e:
             logger.error(f"Failed to get state: {e}")
             return {}
 
-    def get_message_history(self) -> list:
+    def get_message_history(self, thread_id: str | None = None) -> list:
         """Get conversation message history."""
-        state = self.get_state()
+        state = self.get_state(thread_id)
         return state.get("message_history", [])
 
-    def clear_memory(self):
-        """Clear conversation memory for current thread."""
+    def clear_memory(self, thread_id: str | None = None):
+        """Clear conversation memory for a thread (defaults to the current one)."""
         if not self.enable_memory or not self.memory_saver:
             logger.warning("Memory not enabled")
             return
 
+        thread_id = thread_id or self.thread_id
         try:
-            if hasattr(self.memory_saver, "storage"):
-                if self.thread_id in self.memory_saver.storage:
-                    del self.memory_saver.storage[self.thread_id]
-                    logger.info(f"Memory cleared for thread: {self.thread_id}")
+            self.memory_saver.delete_thread(thread_id)
+            logger.info(f"Memory cleared for thread: {thread_id}")
         except Exception as e:
             logger.error(f"Failed to clear memory: {e}")
 
     def _build_graph(self) -> CompiledStateGraph:
         """Build and compile the agent graph with optional memory."""
-        ToolManager.initialize()
+        from langchain_core.runnables import RunnableLambda
+        from langgraph.graph import END, START, StateGraph
+        from langgraph.prebuilt import ToolNode
 
+        # Search tools are built per agent so each is bound to its own Tavily key.
+        tools = create_search_tools(self.researcher_tools, self.tavily_api_key)
         graph_builder = StateGraph(AgentState)
 
+        orchestrator = OrchestratorNode(self.client)
+        researcher = Researcher(self.client, tools=tools)
+
         graph_builder.add_node("preprocessor", QueryProcessor())
-        graph_builder.add_node("orchestrator", OrchestratorNode(self.client))
+        # LLM nodes get native coroutines so async runs await them on the event loop.
         graph_builder.add_node(
-            "researcher", Researcher(self.client, tool_names=self.researcher_tools)
+            "orchestrator", RunnableLambda(orchestrator, afunc=orchestrator.acall)
         )
+        graph_builder.add_node("researcher", RunnableLambda(researcher, afunc=researcher.acall))
         graph_builder.add_node(
             "tool_node",
-            ToolNode(
-                tools=[ToolManager.get_tool(name) for name in self.researcher_tools],
-                messages_key="researcher_history",
-            ),
+            ToolNode(tools=tools, messages_key="researcher_history"),
         )
 
         graph_builder.add_edge(START, "preprocessor")
@@ -173,6 +279,8 @@ class AgentR:
     @staticmethod
     def _should_continue(state: AgentState):
         """Determine if research delegation is needed."""
+        from langgraph.graph import END
+
         return "researcher" if state.get("should_delegate") else END
 
     @staticmethod
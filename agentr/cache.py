@@ -0,0 +1,200 @@
+import json
+import logging
+import math
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, InMemoryCache
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache(InMemoryCache):
+    """In-memory exact-match LLM response cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int | None = 1024):
+        super().__init__(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Look up a cached response and record the hit or miss."""
+        return self._record(self._find(prompt, llm_string))
+
+    async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Look up a cached response asynchronously."""
+        return self._record(await self._afind(prompt, llm_string))
+
+    def clear(self, **kwargs: Any) -> None:
+        """Clear cached responses and reset counters."""
+        super().clear(**kwargs)
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get cache hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "tokens_saved": self.tokens_saved}
+
+    def _find(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Find a cached response for the exact prompt."""
+        return super().lookup(prompt, llm_string)
+
+    async def _afind(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Find a cached response asynchronously."""
+        return self._find(prompt, llm_string)
+
+    def _record(self, cached: RETURN_VAL_TYPE | None) -> RETURN_VAL_TYPE | None:
+        """Count a lookup result as a hit or miss."""
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        tokens = sum(self._total_tokens(generation) for generation in cached)
+        self.tokens_saved += tokens
+        logger.debug("LLM cache hit: %d tokens saved", tokens)
+        return cached
+
+    @staticmethod
+    def _total_tokens(generation: Any) -> int:
+        """Get total token usage recorded on a cached generation."""
+        usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+        return usage.get("total_tokens", 0) if usage else 0
+
+
+class SemanticLLMCache(LLMCache):
+    """LLM response cache that also serves near-duplicate questions by embedding similarity.
+
+    Only single-turn prompts that start with ``system_prompt`` are matched semantically,
+    and only their user question is embedded; every other prompt is matched exactly.
+    Only tool-call responses (the orchestrator's research routing) are served by
+    similarity: the prompt's current-time context is not part of the match, so a
+    replayed direct answer to a time-sensitive question could be stale.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        system_prompt: str,
+        threshold: float = 0.97,
+        maxsize: int | None = 1024,
+    ):
+        super().__init__(maxsize=maxsize)
+        self.embeddings = embeddings
+        self.system_prompt = system_prompt
+        self.threshold = threshold
+        self._vectors: dict[tuple[str, str], list[float]] = {}
+        # The question embedded on a miss is usually stored right after, so keep it.
+        self._last_embedding: tuple[str, list[float]] | None = None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Cache a response and index its question embedding."""
+        super().update(prompt, llm_string, return_val)
+        question = self._question(prompt)
+        if question is not None and self._is_tool_call(return_val):
+            self._index(prompt, llm_string, self._embed(question))
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Cache a response and index its question embedding asynchronously."""
+        super().update(prompt, llm_string, return_val)
+        question = self._question(prompt)
+        if question is not None and self._is_tool_call(return_val):
+            self._index(prompt, llm_string, await self._aembed(question))
+
+    def clear(self, **kwargs: Any) -> None:
+        """Clear cached responses, embeddings and counters."""
+        super().clear(**kwargs)
+        self._vectors.clear()
+        self._last_embedding = None
+
+    def _find(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Find a cached response for the exact prompt or a near-identical question."""
+        cached = super()._find(prompt, llm_string)
+        if cached is not None or not self._vectors:
+            return cached
+        question = self._question(prompt)
+        if question is None:
+            return None
+        return self._nearest(llm_string, self._embed(question))
+
+    async def _afind(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Find a cached response for the exact prompt or a near-identical question async."""
+        cached = super()._find(prompt, llm_string)
+        if cached is not None or not self._vectors:
+            return cached
+        question = self._question(prompt)
+        if question is None:
+            return None
+        return self._nearest(llm_string, await self._aembed(question))
+
+    def _question(self, prompt: str) -> str | None:
+        """Get the user question of a single-turn prompt under system_prompt, if it is one."""
+        try:
+            messages = [message["kwargs"] for message in json.loads(prompt)]
+        except (ValueError, TypeError, KeyError):
+            return None
+
+        if not messages or messages[0].get("type") != "system":
+            return None
+        if messages[0].get("content") != self.system_prompt:
+            return None
+
+        # System messages after the question (e.g. the current time) don't change it.
+        turns = [message for message in messages if message.get("type") != "system"]
+        if len(turns) != 1 or turns[0].get("type") != "human":
+            return None
+        content = turns[0].get("content")
+        return content if isinstance(content, str) else None
+
+    @staticmethod
+    def _is_tool_call(return_val: RETURN_VAL_TYPE) -> bool:
+        """Check whether every cached generation is a tool call rather than an answer."""
+        return bool(return_val) and all(
+            getattr(getattr(generation, "message", None), "tool_calls", None)
+            for generation in return_val
+        )
+
+    def _embed(self, text: str) -> list[float]:
+        """Embed text as a unit vector."""
+        if self._last_embedding and self._last_embedding[0] == text:
+            return self._last_embedding[1]
+        vector = self._normalize(self.embeddings.embed_query(text))
+        self._last_embedding = (text, vector)
+        return vector
+
+    async def _aembed(self, text: str) -> list[float]:
+        """Embed text as a unit vector asynchronously."""
+        if self._last_embedding and self._last_embedding[0] == text:
+            return self._last_embedding[1]
+        vector = self._normalize(await self.embeddings.aembed_query(text))
+        self._last_embedding = (text, vector)
+        return vector
+
+    def _index(self, prompt: str, llm_string: str, vector: list[float]):
+        """Store a question embedding, dropping embeddings of evicted responses."""
+        self._vectors[prompt, llm_string] = vector
+        if len(self._vectors) > len(self._cache):
+            self._vectors = {key: v for key, v in self._vectors.items() if key in self._cache}
+
+    def _nearest(self, llm_string: str, vector: list[float]) -> RETURN_VAL_TYPE | None:
+        """Get the response whose question is most similar, if above the threshold."""
+        best_key, best_score = None, self.threshold
+        for key, candidate in self._vectors.items():
+            if key[1] != llm_string:
+                continue
+            score = sum(a * b for a, b in zip(vector, candidate))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        logger.debug("Semantic cache match: similarity=%.3f", best_score)
+        return self._cache.get(best_key)
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float]:
+        """Scale a vector to unit length so dot products are cosine similarities."""
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
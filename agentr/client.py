@@ -1,14 +1,79 @@
+import json
 import logging
-from langchain_core.messages import AIMessage, BaseMessage
+import re
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any
+import httpx
+from langchain_core.caches import BaseCache
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    convert_to_messages,
+    convert_to_openai_messages,
+)
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.runnables import Runnable
 from langchain_core.tools import StructuredTool
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from pydantic import SecretStr
 
+from .cache import LLMCache, SemanticLLMCache
 from .config import EnvConfig
-from .exceptions import ClientInitializationError
+from .exceptions import ClientInitializationError, ResponseError
+from .graph_utils import dumps, extract_text_response
+from .prompts import (
+    MARSHALED_BATCH_INSTRUCTIONS,
+    MARSHALED_TASK_TEMPLATE,
+    ORCHESTRATOR_PROMPT,
+)
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the optional h2 package.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+# Idle connections outlive the pause between interactive turns instead of httpx's 5s default.
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+
+# Larger marshaled requests save round trips but answer more slowly and less reliably.
+MAX_MARSHALED_PROMPTS = 20
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+
+_RESULT_HEADER = re.compile(r"^### Result (\d+)[ \t]*\n?", re.MULTILINE)
+
+
+HTTP_CLIENT_OPTIONS: dict[str, Any] = {
+    "http2": HTTP2_AVAILABLE,
+    "limits": HTTP_LIMITS,
+    "timeout": HTTP_TIMEOUT,
+}
+
+
+def create_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Create sync and async HTTP clients with a pool sized for concurrent requests."""
+    return httpx.Client(**HTTP_CLIENT_OPTIONS), httpx.AsyncClient(**HTTP_CLIENT_OPTIONS)
+
+
+@lru_cache(maxsize=1)
+def get_shared_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Get the process-wide HTTP clients so every OpenAIClient reuses one connection pool."""
+    return create_http_clients()
+
+
+def create_rate_limiter(requests_per_minute: int | None) -> InMemoryRateLimiter | None:
+    """Create a token bucket shared by all calls so batches stay under the RPM limit."""
+    if not requests_per_minute:
+        return None
+    requests_per_second = requests_per_minute / 60
+    return InMemoryRateLimiter(
+        requests_per_second=requests_per_second,
+        check_every_n_seconds=min(0.1, 1 / requests_per_second),
+        max_bucket_size=max(1, int(requests_per_second)),
+    )
+
 
 class OpenAIClient:
     """Wrapper around ChatOpenAI with structured tool support."""
@@ -19,12 +84,34 @@ class OpenAIClient:
         api_key: str | None = None,
         api_url: str | None = None,
         client_config: EnvConfig | None = None,
+        prompt_cache_key: str | None = None,
+        cache: BaseCache | None = None,
+        use_responses_api: bool = False,
+        requests_per_minute: int | None = None,
+        http_client: httpx.Client | None = None,
+        http_async_client: httpx.AsyncClient | None = None,
+        share_http_pool: bool = True,
     ):
         """Initialize the OpenAI client."""
         if client_config:
             self.api_key = client_config.api_key
             self.model = client_config.model_name
             self.api_url = client_config.api_url
+            prompt_cache_key = prompt_cache_key or client_config.prompt_cache_key or None
+            if cache is None and client_config.semantic_cache:
+                # Only the orchestrator's first-turn route is matched semantically.
+                cache = SemanticLLMCache(
+                    OpenAIEmbeddings(
+                        model=client_config.embedding_model,
+                        api_key=SecretStr(self.api_key),
+                        base_url=self.api_url,
+                    ),
+                    system_prompt=ORCHESTRATOR_PROMPT,
+                )
+            elif cache is None and client_config.llm_cache:
+                cache = LLMCache()
+            use_responses_api = use_responses_api or client_config.use_responses_api
+            requests_per_minute = requests_per_minute or client_config.requests_per_minute
         elif api_key and model:
             self.api_key = api_key
             self.model = model
@@ -34,40 +121,261 @@ class OpenAIClient:
                 "Provide either client_config or both api_key and model"
             )
 
+        # Responses API conversations chain on the previous response id, so only
+        # messages added since the last model turn are sent.
+        responses_kwargs = (
+            {"use_responses_api": True, "use_previous_response_id": True}
+            if use_responses_api
+            else {}
+        )
+        # Clients share the process-wide pool by default so keep-alive connections are
+        # reused across models; share_http_pool=False gives this client a private pool.
+        # Only pools created here are closed by close()/aclose(); shared and injected
+        # pools may still be in use by other clients.
+        self._owned_http_clients: list[httpx.Client | httpx.AsyncClient] = []
+        if not share_http_pool:
+            if http_client is None:
+                http_client = httpx.Client(**HTTP_CLIENT_OPTIONS)
+                self._owned_http_clients.append(http_client)
+            if http_async_client is None:
+                http_async_client = httpx.AsyncClient(**HTTP_CLIENT_OPTIONS)
+                self._owned_http_clients.append(http_async_client)
+        if http_client is None or http_async_client is None:
+            shared_http_client, shared_http_async_client = get_shared_http_clients()
+            http_client = http_client or shared_http_client
+            http_async_client = http_async_client or shared_http_async_client
+        self.http_client = http_client
+        self.http_async_client = http_async_client
+        self.rate_limiter = create_rate_limiter(requests_per_minute)
         self.client = ChatOpenAI(
             model=self.model,
             api_key=SecretStr(self.api_key),
             base_url=self.api_url,
+            cache=cache,
+            http_client=self.http_client,
+            http_async_client=self.http_async_client,
+            rate_limiter=self.rate_limiter,
+            **responses_kwargs,
         )
-        logger.info(f"OpenAI client initialized: model={self.model}")
+        self.cache = cache
+        self.prompt_cache_key = prompt_cache_key
+        self._bound_cache: dict[tuple[tuple[str, ...], bool], Runnable] = {}
+        logger.info("OpenAI client initialized: model=%s, http2=%s", self.model, HTTP2_AVAILABLE)
 
     def chat(self, messages: list[BaseMessage]) -> AIMessage:
         """Send messages and get response."""
-        logger.debug(f"Chat API call with {len(messages)} messages")
+        logger.debug("Chat API call with %d messages", len(messages))
         try:
             response = self.client.invoke(input=messages)
-            if (
-                hasattr(response, "response_metadata")
-                and "token_usage" in response.response_metadata
-            ):
-                tokens = response.response_metadata["token_usage"]
-                logger.debug(f"API call: {tokens.get('total_tokens', 'N/A')} tokens")
+            token_usage = response.response_metadata.get("token_usage")
+            if token_usage is not None:
+                logger.debug("API call: %s tokens", token_usage.get("total_tokens", "N/A"))
             return response
         except Exception as e:
-            logger.error(f"Chat API call failed: {type(e).__name__}")
+            logger.error("Chat API call failed: %s", type(e).__name__)
             raise
 
+    async def achat(self, messages: list[BaseMessage]) -> AIMessage:
+        """Send messages and get response asynchronously."""
+        logger.debug("Async chat API call with %d messages", len(messages))
+        try:
+            return await self.client.ainvoke(input=messages)
+        except Exception as e:
+            logger.error("Async chat API call failed: %s", type(e).__name__)
+            raise
+
+    def batch_chat(
+        self, batch: list[list[BaseMessage]], max_concurrency: int | None = None
+    ) -> list[AIMessage]:
+        """Send independent conversations concurrently, preserving order."""
+        logger.debug("Batch chat API call with %d conversations", len(batch))
+        try:
+            return self.client.batch(batch, config={"max_concurrency": max_concurrency})
+        except Exception as e:
+            logger.error("Batch chat API call failed: %s", type(e).__name__)
+            raise
+
+    async def abatch_chat(
+        self, batch: list[list[BaseMessage]], max_concurrency: int | None = None
+    ) -> list[AIMessage]:
+        """Send independent conversations concurrently on the event loop, preserving order."""
+        logger.debug("Async batch chat API call with %d conversations", len(batch))
+        try:
+            return await self.client.abatch(batch, config={"max_concurrency": max_concurrency})
+        except Exception as e:
+            logger.error("Async batch chat API call failed: %s", type(e).__name__)
+            raise
+
+    async def chat_many(
+        self,
+        system_message: BaseMessage,
+        batches: list[list[BaseMessage]],
+        max_concurrency: int = 16,
+    ) -> list[AIMessage]:
+        """Answer conversations sharing a system prompt in order; a failure raises its error."""
+        return await self.abatch_chat(
+            [[system_message, *messages] for messages in batches],
+            max_concurrency=max_concurrency,
+        )
+
+    def chat_marshaled(
+        self,
+        system_message: BaseMessage,
+        prompts: list[str],
+        row_count: int = MAX_MARSHALED_PROMPTS,
+    ) -> list[str]:
+        """Answer many short prompts by packing up to row_count of them into each request."""
+        groups = [prompts[i : i + row_count] for i in range(0, len(prompts), row_count)]
+        responses = self.batch_chat(
+            [[system_message, self._marshal_prompts(group)] for group in groups]
+        )
+        return [
+            answer
+            for group, response in zip(groups, responses)
+            for answer in self._unmarshal_response(response, len(group))
+        ]
+
+    @staticmethod
+    def _marshal_prompts(prompts: list[str]) -> HumanMessage:
+        """Pack numbered prompts into one request."""
+        tasks = "\n\n".join(
+            MARSHALED_TASK_TEMPLATE.format(index=i, prompt=prompt)
+            for i, prompt in enumerate(prompts, start=1)
+        )
+        return HumanMessage(content=f"{MARSHALED_BATCH_INSTRUCTIONS}\n\n{tasks}")
+
+    @staticmethod
+    def _unmarshal_response(response: AIMessage, count: int) -> list[str]:
+        """Split a marshaled response into one answer per prompt."""
+        parts = _RESULT_HEADER.split(extract_text_response(response))
+        answers = {int(index): answer.strip() for index, answer in zip(parts[1::2], parts[2::2])}
+        missing = [i for i in range(1, count + 1) if i not in answers]
+        if missing:
+            raise ResponseError(f"Marshaled response is missing results {missing}")
+        return [answers[i] for i in range(1, count + 1)]
+
+    def submit_batch(self, batch: list[list[BaseMessage]]) -> str:
+        """Submit conversations to the Batch API for cheaper, asynchronous completion."""
+        lines = [
+            dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": {"model": self.model, "messages": convert_to_openai_messages(messages)},
+                }
+            )
+            for i, messages in enumerate(batch)
+        ]
+        root_client = self.client.root_client
+        input_file = root_client.files.create(
+            file=("agentr-batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        job = root_client.batches.create(
+            input_file_id=input_file.id, endpoint=BATCH_ENDPOINT, completion_window="24h"
+        )
+        logger.info("Submitted batch %s with %d conversations", job.id, len(batch))
+        return job.id
+
+    def poll_batch(self, batch_id: str) -> list[AIMessage] | None:
+        """Get batch responses in submission order, or None while the batch is still running."""
+        root_client = self.client.root_client
+        job = root_client.batches.retrieve(batch_id)
+        if job.status in BATCH_FAILED_STATUSES:
+            raise ResponseError(f"Batch {batch_id} {job.status}")
+        if job.status != "completed":
+            return None
+        if job.request_counts and job.request_counts.failed:
+            raise ResponseError(f"Batch {batch_id}: {job.request_counts.failed} requests failed")
+
+        output = root_client.files.content(job.output_file_id).text
+        results = sorted(
+            (json.loads(line) for line in output.splitlines() if line),
+            key=lambda result: int(result["custom_id"]),
+        )
+        return [self._batch_result_message(result) for result in results]
+
+    @staticmethod
+    def _batch_result_message(result: dict[str, Any]) -> AIMessage:
+        """Convert one Batch API output line into an AIMessage."""
+        body = result["response"]["body"]
+        message = body["choices"][0]["message"]
+        response = convert_to_messages([{**message, "content": message.get("content") or ""}])[0]
+        response.usage_metadata = {
+            "input_tokens": body["usage"]["prompt_tokens"],
+            "output_tokens": body["usage"]["completion_tokens"],
+            "total_tokens": body["usage"]["total_tokens"],
+        }
+        return response
+
     def with_structured_output(
         self,
         messages: list[BaseMessage],
-        tools: list[StructuredTool],
+        tools: list[StructuredTool | dict[str, Any]],
         parallel: bool = False,
+        cache_scope: str | None = None,
     ) -> AIMessage:
         """Invoke LLM with structured tools."""
-        logger.debug(f"Structured output: {len(messages)} messages, {len(tools)} tools")
+        logger.debug("Structured output: %d messages, %d tools", len(messages), len(tools))
         try:
-            llm_with_tools = self.client.bind_tools(tools=tools, parallel_tool_calls=parallel)
-            return llm_with_tools.invoke(input=messages)
+            llm_with_tools = self._bind_tools(tools, parallel)
+            return llm_with_tools.invoke(input=messages, **self._cache_kwargs(cache_scope))
+        except Exception as e:
+            logger.error("Structured output failed: %s", type(e).__name__)
+            raise
+
+    async def awith_structured_output(
+        self,
+        messages: list[BaseMessage],
+        tools: list[StructuredTool | dict[str, Any]],
+        parallel: bool = False,
+        cache_scope: str | None = None,
+    ) -> AIMessage:
+        """Invoke LLM with structured tools asynchronously."""
+        logger.debug("Async structured output: %d messages, %d tools", len(messages), len(tools))
+        try:
+            llm_with_tools = self._bind_tools(tools, parallel)
+            return await llm_with_tools.ainvoke(input=messages, **self._cache_kwargs(cache_scope))
         except Exception as e:
-            logger.error(f"Structured output failed: {type(e).__name__}")
+            logger.error("Async structured output failed: %s", type(e).__name__)
             raise
+
+    def _bind_tools(self, tools: list[StructuredTool | dict[str, Any]], parallel: bool) -> Runnable:
+        """Get LLM bound to tools or precomputed schemas, reusing known bindings."""
+        key = (tuple(self._tool_name(tool) for tool in tools), parallel)
+        llm_with_tools = self._bound_cache.get(key)
+        if llm_with_tools is None:
+            llm_with_tools = self.client.bind_tools(tools=tools, parallel_tool_calls=parallel)
+            self._bound_cache[key] = llm_with_tools
+        return llm_with_tools
+
+    @staticmethod
+    def _tool_name(tool: StructuredTool | dict[str, Any]) -> str:
+        """Get the name of a tool or OpenAI tool schema."""
+        if isinstance(tool, dict):
+            return tool["function"]["name"]
+        return tool.name
+
+    def _cache_kwargs(self, cache_scope: str | None) -> dict:
+        """Get request kwargs routing calls with a shared prompt prefix to the same cache."""
+        if not self.prompt_cache_key or not cache_scope:
+            return {}
+        return {"prompt_cache_key": f"{self.prompt_cache_key}-{cache_scope}"}
+
+    def clear_cache(self):
+        """Clear cached tool bindings."""
+        self._bound_cache.clear()
+
+    def close(self):
+        """Close the sync connection pool this client created, if any."""
+        for http_client in self._owned_http_clients:
+            if isinstance(http_client, httpx.Client):
+                http_client.close()
+
+    async def aclose(self):
+        """Close the connection pools this client created, if any."""
+        for http_client in self._owned_http_clients:
+            if isinstance(http_client, httpx.AsyncClient):
+                await http_client.aclose()
+            else:
+                http_client.close()
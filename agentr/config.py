@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cache
 from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
@@ -18,14 +19,17 @@ class EnvConfig(BaseSettings):
     langfuse_secret_key: str = ""
     log_level: str = "INFO"
     environment: str = "development"
-
-    _instance: EnvConfig | None = None
+    prompt_cache_key: str = ""
+    llm_cache: bool = False
+    semantic_cache: bool = False
+    embedding_model: str = "text-embedding-3-small"
+    use_responses_api: bool = False
+    requests_per_minute: int = 0
 
     @classmethod
     def get_instance(cls) -> EnvConfig:
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the cached configuration instance."""
+        return get_settings()
 
     model_config = {
         "env_file": ".env",
@@ -33,9 +37,15 @@ class EnvConfig(BaseSettings):
     }
 
     def model_post_init(self, __context):
-        logger.info(f"Configuration loaded: model={self.model_name}, env={self.environment}")
+        logger.info("Configuration loaded: model=%s, env=%s", self.model_name, self.environment)
+
+
+@cache
+def get_settings(**overrides) -> EnvConfig:
+    """Get cached configuration, loading .env only once per set of overrides."""
+    return EnvConfig(**overrides)
 
 
 def get_default_runtime_config() -> dict:
     """Get default runtime configuration."""
-    return {"max_iterations": 4}
+    return {"max_iterations": 4, "max_history_messages": 50}
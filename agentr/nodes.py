@@ -1,5 +1,8 @@
 import logging
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from langchain_core.messages import (
     AIMessage,
     BaseMessage,
@@ -8,15 +11,20 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ValidationError as PydanticValidationError
 
-from .client import OpenAIClient
 from .graph_utils import (
+    dumps,
     extract_text_response,
     format_research_synthesis,
     is_tool_call,
     parse_research_results,
+    trim_history,
 )
 from .prompts import (
+    CURRENT_TIME_TEMPLATE,
     ORCHESTRATOR_PROMPT,
     RESEARCHER_PROMPT,
     MAX_ITERATION_MESSAGE,
@@ -28,11 +36,30 @@ from .states import (
     Source,
     SourceType,
 )
-from .tools import ShouldResearch, ToolManager, ToolName
+from .tools import RESEARCH_TOOL_SCHEMA, ShouldResearch
+
+if TYPE_CHECKING:
+    from .client import OpenAIClient
 
 logger = logging.getLogger(__name__)
 
 
+ORCHESTRATOR_SYSTEM_MESSAGE = SystemMessage(content=ORCHESTRATOR_PROMPT)
+RESEARCHER_SYSTEM_MESSAGE = SystemMessage(content=RESEARCHER_PROMPT)
+
+
+@lru_cache(maxsize=2)
+def _time_message(minute: int) -> SystemMessage:
+    """Build the current-time context for a minute bucket."""
+    current_time = datetime.fromtimestamp(minute * 60, UTC).isoformat()
+    return SystemMessage(content=CURRENT_TIME_TEMPLATE.format(current_time=current_time))
+
+
+def current_time_message() -> SystemMessage:
+    """Get the current-time context, sent after the cacheable prompt prefix."""
+    return _time_message(int(time.time()) // 60)
+
+
 class QueryProcessor:
     """Process user queries into message history."""
 
@@ -48,25 +75,57 @@ class QueryProcessor:
 class OrchestratorNode:
     """Orchestrate between direct response and research delegation."""
 
-    def __init__(self, llm_client: OpenAIClient):
+    def __init__(self, llm_client: "OpenAIClient"):
         self.client = llm_client
-
-    @staticmethod
-    def _get_system_prompt() -> str:
-        """Get formatted system prompt with current time."""
-        return ORCHESTRATOR_PROMPT.format(current_time=datetime.now(UTC).isoformat())
+        self._tool_schemas = [RESEARCH_TOOL_SCHEMA]
 
     def __call__(self, state: OrchestratorState, config: RunnableConfig) -> OrchestratorState:
         """Execute orchestrator logic."""
-        system_message = SystemMessage(content=self._get_system_prompt())
-        message_history = state.get("message_history", [])
-        messages = [system_message, *message_history]
-
+        messages = self._build_messages(state, config)
         response = self.client.with_structured_output(
             messages=messages,
-            tools=[ToolManager.get_tool(ToolName.RESEARCH_TOOL)],
+            tools=self._tool_schemas,
+            cache_scope="orchestrator",
+        )
+        if self._has_empty_plan(response):
+            response = self.client.chat(messages)
+        return self._handle_response(response)
+
+    async def acall(self, state: OrchestratorState, config: RunnableConfig) -> OrchestratorState:
+        """Execute orchestrator logic asynchronously."""
+        messages = self._build_messages(state, config)
+        response = await self.client.awith_structured_output(
+            messages=messages,
+            tools=self._tool_schemas,
+            cache_scope="orchestrator",
         )
+        if self._has_empty_plan(response):
+            response = await self.client.achat(messages)
+        return self._handle_response(response)
 
+    @staticmethod
+    def _build_messages(state: OrchestratorState, config: RunnableConfig) -> list[BaseMessage]:
+        """Build orchestrator prompt from recent conversation history."""
+        max_history_messages = (config.get("configurable") or {}).get("max_history_messages")
+        message_history = trim_history(state.get("message_history", []), max_history_messages)
+        return [ORCHESTRATOR_SYSTEM_MESSAGE, *message_history, current_time_message()]
+
+    @staticmethod
+    def _has_empty_plan(response: AIMessage) -> bool:
+        """Check whether research was delegated without a usable subtask."""
+        if not is_tool_call(response):
+            return False
+        try:
+            ShouldResearch(**response.tool_calls[0]["args"])
+        except PydanticValidationError:
+            # Answer directly instead of running the researcher with nothing to search.
+            logger.warning("Research delegated without subtasks, answering directly")
+            return True
+        return False
+
+    @staticmethod
+    def _handle_response(response: AIMessage) -> OrchestratorState:
+        """Route orchestrator response to research delegation or a direct answer."""
         if is_tool_call(response):
             tool_call = response.tool_calls[0]
             research_id = tool_call.get("id")
@@ -91,19 +150,41 @@ class OrchestratorNode:
 class Researcher:
     """Conduct iterative research using web search."""
 
-    def __init__(self, llm_client: OpenAIClient, tool_names: list[ToolName]):
+    def __init__(self, llm_client: "OpenAIClient", tools: list[StructuredTool]):
         self.client = llm_client
-        self.tool_names = tool_names
-        self._tools = [ToolManager.get_tool(name) for name in tool_names]
-        self.research_findings: list[Source] = []
-
-    @staticmethod
-    def _get_system_prompt() -> str:
-        """Get formatted system prompt with current time."""
-        return RESEARCHER_PROMPT.format(current_time=datetime.now(UTC).isoformat())
+        self._tool_schemas = [convert_to_openai_tool(tool) for tool in tools]
 
     def __call__(self, state: ResearcherState, config: RunnableConfig) -> ResearcherState:
         """Execute researcher logic."""
+        if self._reached_max_iterations(state, config):
+            return self._handle_max_iterations(state)
+
+        messages, request = self._build_request(state)
+        response = self.client.with_structured_output(
+            messages=messages,
+            tools=self._tool_schemas,
+            parallel=True,
+            cache_scope="researcher",
+        )
+        return self._handle_response(state, request, response)
+
+    async def acall(self, state: ResearcherState, config: RunnableConfig) -> ResearcherState:
+        """Execute researcher logic asynchronously."""
+        if self._reached_max_iterations(state, config):
+            return self._handle_max_iterations(state)
+
+        messages, request = self._build_request(state)
+        response = await self.client.awith_structured_output(
+            messages=messages,
+            tools=self._tool_schemas,
+            parallel=True,
+            cache_scope="researcher",
+        )
+        return self._handle_response(state, request, response)
+
+    @staticmethod
+    def _reached_max_iterations(state: ResearcherState, config: RunnableConfig) -> bool:
+        """Check the iteration limit from the runtime config."""
         configurables = config.get("configurable")
         if not configurables:
             raise ValueError("Configurables not passed in config")
@@ -113,32 +194,34 @@ class Researcher:
             raise TypeError(f"max_iterations must be int, got {type(max_iterations).__name__}")
 
         current_iteration = state.get("current_iteration", 0)
+        return current_iteration != 0 and current_iteration > max_iterations
 
-        system_message = SystemMessage(content=self._get_system_prompt())
-        researcher_history = state.get("researcher_history", [])
-        messages = [system_message, *researcher_history]
+    @staticmethod
+    def _build_request(state: ResearcherState) -> tuple[list[BaseMessage], HumanMessage | None]:
+        """Build researcher prompt, adding the subtask request on the first iteration."""
+        messages = [RESEARCHER_SYSTEM_MESSAGE, *state.get("researcher_history", [])]
+        if state.get("current_iteration", 0) != 0:
+            return [*messages, current_time_message()], None
 
-        if current_iteration == 0:
-            return self._handle_initial_request(state, messages)
+        request = HumanMessage(content=dumps(state.get("planned_subtasks", [])))
+        return [*messages, request, current_time_message()], request
 
-        if current_iteration > max_iterations:
-            return self._handle_max_iterations(state)
+    def _handle_response(
+        self, state: ResearcherState, request: HumanMessage | None, response: AIMessage
+    ) -> ResearcherState:
+        """Route researcher response to the next iteration or final results."""
+        if request is not None:
+            return self._handle_initial_response(state, request, response)
+
+        if is_tool_call(response):
+            return self._continue_research(state, response)
 
-        return self._handle_subsequent_iterations(state, messages)
+        return self._finalize_research(state, response)
 
-    def _handle_initial_request(
-        self, state: ResearcherState, messages: list[BaseMessage]
+    def _handle_initial_response(
+        self, state: ResearcherState, request: HumanMessage, response: AIMessage
     ) -> ResearcherState:
         """Handle first research iteration."""
-        subtasks = state.get("planned_subtasks", [])
-        request = HumanMessage(content=str(subtasks))
-        messages_with_request = [*messages, request]
-
-        response = self.client.with_structured_output(
-            messages=messages_with_request,
-            tools=self._tools,
-        )
-
         if not is_tool_call(response):
             raise ValueError("Expected tool call from Researcher, got none")
 
@@ -149,28 +232,8 @@ class Researcher:
             should_continue=True,
         )
 
-    def _handle_subsequent_iterations(
-        self, state: ResearcherState, messages: list[BaseMessage]
-    ) -> ResearcherState:
-        """Handle middle iterations."""
-        response = self.client.with_structured_output(
-            messages=messages,
-            tools=self._tools,
-        )
-
-        if is_tool_call(response):
-            return self._continue_research(state, response)
-
-        return self._finalize_research(state, response)
-
     def _continue_research(self, state: ResearcherState, response: AIMessage) -> ResearcherState:
         """Continue research with new findings."""
-        last_message_content = str(state["researcher_history"][-1].content)
-        parsed_results = parse_research_results(last_message_content)
-
-        new_sources = [Source(**item) for item in parsed_results]
-        self.research_findings.extend(new_sources)
-
         current_iteration = state.get("current_iteration", 0)
         return ResearcherState(
             current_iteration=current_iteration + 1,
@@ -178,6 +241,31 @@ class Researcher:
             should_continue=True,
         )
 
+    @staticmethod
+    def _collect_findings(history: list[BaseMessage]) -> list[Source]:
+        """Collect sources from successful tool results of the current research run."""
+        tool_messages = []
+        for message in reversed(history):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, ToolMessage) and message.status != "error":
+                tool_messages.append(message)
+
+        findings: list[Source] = []
+        seen: set[tuple[str, str]] = set()
+        for message in reversed(tool_messages):
+            if message.artifact is not None:
+                sources = message.artifact
+            else:
+                sources = parse_research_results(str(message.content))
+            # Overlapping queries often return the same result; keep it once.
+            for source in sources:
+                key = (source["source"], source["content"])
+                if key not in seen:
+                    seen.add(key)
+                    findings.append(source)
+        return findings
+
     def _finalize_research(self, state: ResearcherState, response: AIMessage) -> ResearcherState:
         """Finalize research and return results."""
         sub_agent_call_id = state.get("sub_agent_call_id")
@@ -186,7 +274,7 @@ class Researcher:
 
         return ResearcherState(
             message_history=[
-                ToolMessage(content=str(response.content), tool_call_id=sub_agent_call_id)
+                ToolMessage(content=extract_text_response(response), tool_call_id=sub_agent_call_id)
             ],
             researcher_history=[response],
             should_continue=False,
@@ -197,7 +285,7 @@ class Researcher:
 
     def _handle_max_iterations(self, state: ResearcherState) -> ResearcherState:
         """Handle max iteration limit."""
-        synthesis = format_research_synthesis(self.research_findings)
+        synthesis = format_research_synthesis(self._collect_findings(state["researcher_history"]))
         sub_agent_call_id = state.get("sub_agent_call_id")
         if not sub_agent_call_id:
             raise ValueError("sub_agent_call_id not found in state")
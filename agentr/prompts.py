@@ -20,8 +20,6 @@ When delegating:
 - Break the request into 3-5 specific, actionable tasks
 - Make each task clear and focused
 - Order tasks logically
-
-Current time (UTC): {current_time}
 """
 
 RESEARCHER_PROMPT = """# AGENTR RESEARCHER
@@ -37,7 +35,8 @@ You are the research specialist. Your responsibilities:
 - For current topics, include "latest" or "recent"
 
 ## ITERATION CONTROL
-- Focus on one subtask per iteration
+- Search independent subtasks together: issue one batch_web_search call with a query per subtask
+- Use web_search for a single follow-up query
 - Build on previous findings
 - Stop when all subtasks addressed or max iterations reached
 
@@ -47,10 +46,10 @@ Prioritize:
 2. Official sources  
 3. Established media
 4. Expert publications
-
-Current time (UTC): {current_time}
 """
 
+CURRENT_TIME_TEMPLATE = "Current time (UTC): {current_time}"
+
 MAX_ITERATION_MESSAGE = "Maximum iteration limit reached. Research complete."
 
 RESEARCH_SYNTHESIS_TEMPLATE = """Research Complete - Findings Summary
@@ -61,3 +60,8 @@ Total Sources: {total_sources}
 
 ---
 Status: Complete"""
+
+MARSHALED_BATCH_INSTRUCTIONS = """Complete each task below independently.
+Reply with one section per task, in order, each starting with a line "### Result <n>" where <n> is the task number, followed by that task's answer only."""
+
+MARSHALED_TASK_TEMPLATE = "### Task {index}\n{prompt}"
@@ -1,14 +1,23 @@
+import asyncio
 import logging
+import threading
+import weakref
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import StrEnum
-from typing import Any, ClassVar
+from functools import cache
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 from langchain_core.tools import StructuredTool
-from pydantic import BaseModel, Field
-from tavily import TavilyClient, AsyncTavilyClient
+from pydantic import BaseModel, Field, field_validator
 
-from .config import EnvConfig
+from .config import get_settings
 from .exceptions import ToolInitializationError
+from .graph_utils import dumps
 from .states import Source, SourceType
 
+if TYPE_CHECKING:
+    from tavily import AsyncTavilyClient, TavilyClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +25,7 @@ class ToolName(StrEnum):
     """Available tool names."""
 
     WEB_SEARCH = "web_search"
+    BATCH_WEB_SEARCH = "batch_web_search"
     RESEARCH_TOOL = "research_sub_agent"
 
 
@@ -26,20 +36,50 @@ class SearchInput(BaseModel):
     query: str = Field(..., description="Search query", min_length=1, max_length=500)
 
 
-def _get_tavily_client() -> TavilyClient:
-    """Get Tavily client instance."""
-    config = EnvConfig()  # type: ignore
-    if not config.tavily_api_key:
+def _resolve_tavily_api_key(api_key: str | None) -> str:
+    """Resolve Tavily API key, falling back to settings."""
+    api_key = api_key or get_settings().tavily_api_key
+    if not api_key:
         raise ToolInitializationError("TAVILY_API_KEY not set")
-    return TavilyClient(api_key=config.tavily_api_key)
+    return api_key
 
 
-def _get_async_tavily_client() -> AsyncTavilyClient:
-    """Get async Tavily client instance."""
-    config = EnvConfig()  # type: ignore
-    if not config.tavily_api_key:
-        raise ToolInitializationError("TAVILY_API_KEY not set")
-    return AsyncTavilyClient(api_key=config.tavily_api_key)
+@cache
+def _create_tavily_client(api_key: str) -> "TavilyClient":
+    """Create a Tavily client, shared per API key so its connection pool is reused."""
+    from tavily import TavilyClient
+
+    return TavilyClient(api_key=api_key)
+
+
+# Async clients hold loop-bound connections, so they are shared per event loop.
+_async_tavily_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, "AsyncTavilyClient"]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_tavily_client(api_key: str | None = None) -> "TavilyClient":
+    """Get Tavily client instance."""
+    return _create_tavily_client(_resolve_tavily_api_key(api_key))
+
+
+def _get_async_tavily_client(api_key: str | None = None) -> "AsyncTavilyClient":
+    """Get async Tavily client instance for the running event loop."""
+    api_key = _resolve_tavily_api_key(api_key)
+    loop_clients = _async_tavily_clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(api_key)
+    if client is None:
+        from tavily import AsyncTavilyClient
+
+        client = AsyncTavilyClient(api_key=api_key)
+        loop_clients[api_key] = client
+    return client
+
+
+def clear_tavily_clients():
+    """Drop cached Tavily clients."""
+    _create_tavily_client.cache_clear()
+    _async_tavily_clients.clear()
 
 
 def _format_tavily_response(response: dict[str, Any]) -> list[Source]:
@@ -58,57 +98,192 @@ def _format_tavily_response(response: dict[str, Any]) -> list[Source]:
     ]
 
 
-def web_search_sync(query: str) -> list[Source]:
+def web_search_sync(query: str, api_key: str | None = None) -> list[Source]:
     """Synchronous web search."""
     logger.debug(f"Web search: {query[:50]}...")
-    client = _get_tavily_client()
+    client = _get_tavily_client(api_key)
     response = client.search(query=query)
     sources = _format_tavily_response(response)
     logger.debug(f"Found {len(sources)} sources")
     return sources
 
 
-async def web_search_async(query: str) -> list[Source]:
+async def web_search_async(query: str, api_key: str | None = None) -> list[Source]:
     """Asynchronous web search."""
     logger.debug(f"Async web search: {query[:50]}...")
-    client = _get_async_tavily_client()
+    client = _get_async_tavily_client(api_key)
     response = await client.search(query=query)
     sources = _format_tavily_response(response)
     logger.debug(f"Found {len(sources)} sources")
     return sources
 
 
-def create_web_search_tool() -> StructuredTool:
-    """Create web search tool."""
+def _to_tool_output(sources: list[Source]) -> tuple[str, list[Source]]:
+    """Pair serialized sources for the LLM with the structured sources as artifact."""
+    return dumps(sources), sources
+
+
+def create_web_search_tool(tavily_api_key: str | None = None) -> StructuredTool:
+    """Create web search tool bound to a Tavily API key."""
+
+    def search(query: str) -> tuple[str, list[Source]]:
+        return _to_tool_output(web_search_sync(query, api_key=tavily_api_key))
+
+    async def asearch(query: str) -> tuple[str, list[Source]]:
+        return _to_tool_output(await web_search_async(query, api_key=tavily_api_key))
+
     return StructuredTool.from_function(
         name=ToolName.WEB_SEARCH,
         description="Search the web for up-to-date information. Returns results with source URLs.",
         args_schema=SearchInput,
-        func=web_search_sync,
-        coroutine=web_search_async,
+        func=search,
+        coroutine=asearch,
+        response_format="content_and_artifact",
     )
 
 
+# BATCH WEB SEARCH TOOL
+MAX_BATCH_QUERIES = 8
+
+# Shared across calls so sync batch searches don't spin up worker threads each time.
+_search_executor = ThreadPoolExecutor(
+    max_workers=MAX_BATCH_QUERIES, thread_name_prefix="agentr-search"
+)
+
+
+class BatchSearchInput(BaseModel):
+    """Batch web search input schema."""
+
+    queries: list[Annotated[str, Field(min_length=1, max_length=500)]] = Field(
+        ...,
+        description="Independent search queries, one per subtask",
+        min_length=1,
+        max_length=MAX_BATCH_QUERIES,
+    )
+
+
+def _merge_batch_responses(queries: list[str], responses: list[Any]) -> list[Source]:
+    """Merge per-query Tavily responses, skipping queries that failed."""
+    sources: list[Source] = []
+    for query, response in zip(queries, responses):
+        if isinstance(response, BaseException):
+            logger.warning(f"Batch search failed for '{query[:50]}': {type(response).__name__}")
+            continue
+        sources.extend(_format_tavily_response(response))
+
+    if responses and all(isinstance(response, BaseException) for response in responses):
+        raise responses[0]
+
+    logger.debug(f"Batch search found {len(sources)} sources for {len(queries)} queries")
+    return sources
+
+
+def batch_web_search_sync(queries: list[str], api_key: str | None = None) -> list[Source]:
+    """Run several web searches concurrently with one Tavily client."""
+    client = _get_tavily_client(api_key)
+    futures = [_search_executor.submit(client.search, query=query) for query in queries]
+    wait(futures)
+    responses = [future.exception() or future.result() for future in futures]
+    return _merge_batch_responses(queries, responses)
+
+
+async def batch_web_search_async(queries: list[str], api_key: str | None = None) -> list[Source]:
+    """Run several web searches concurrently with one async Tavily client."""
+    client = _get_async_tavily_client(api_key)
+    responses = await asyncio.gather(
+        *(client.search(query=query) for query in queries), return_exceptions=True
+    )
+    return _merge_batch_responses(queries, list(responses))
+
+
+def create_batch_web_search_tool(tavily_api_key: str | None = None) -> StructuredTool:
+    """Create batch web search tool bound to a Tavily API key."""
+
+    def search(queries: list[str]) -> tuple[str, list[Source]]:
+        return _to_tool_output(batch_web_search_sync(queries, api_key=tavily_api_key))
+
+    async def asearch(queries: list[str]) -> tuple[str, list[Source]]:
+        return _to_tool_output(await batch_web_search_async(queries, api_key=tavily_api_key))
+
+    return StructuredTool.from_function(
+        name=ToolName.BATCH_WEB_SEARCH,
+        description=(
+            "Search the web for several independent queries at once. "
+            "Returns the merged results with source URLs."
+        ),
+        args_schema=BatchSearchInput,
+        func=search,
+        coroutine=asearch,
+        response_format="content_and_artifact",
+    )
+
+
+SEARCH_TOOL_FACTORIES = {
+    ToolName.WEB_SEARCH: create_web_search_tool,
+    ToolName.BATCH_WEB_SEARCH: create_batch_web_search_tool,
+}
+
+
+def create_search_tools(
+    names: Iterable[ToolName | str], tavily_api_key: str | None = None
+) -> list[StructuredTool]:
+    """Create search tools bound to one Tavily API key."""
+    try:
+        return [SEARCH_TOOL_FACTORIES[name](tavily_api_key) for name in names]
+    except KeyError as e:
+        raise KeyError(f"Tool '{e.args[0]}' is not a search tool") from None
+
+
 # RESEARCH DECISION TOOL
+MAX_SUBTASKS = 5
+
+
 class ShouldResearch(BaseModel):
     """Research decision schema."""
 
     subtasks: list[str]
 
+    @field_validator("subtasks")
+    @classmethod
+    def _dedupe_and_cap(cls, subtasks: list[str]) -> list[str]:
+        """Drop blank and duplicate subtasks and keep at most MAX_SUBTASKS."""
+        stripped = (subtask.strip() for subtask in subtasks)
+        subtasks = list(dict.fromkeys(subtask for subtask in stripped if subtask))
+        if not subtasks:
+            raise ValueError("At least one non-blank subtask is required")
+        return subtasks[:MAX_SUBTASKS]
+
 
 def research_subagent(subtasks: list[str]) -> ShouldResearch:
     """Research subagent handoff function."""
     return ShouldResearch(subtasks=subtasks)
 
 
+RESEARCH_TOOL_DESCRIPTION = (
+    "Use this tool to delegate research to a sub-agent. Provide independent subtasks "
+    "that together answer the user's question."
+)
+
+# Written out by hand so binding the orchestrator's only tool skips schema generation.
+RESEARCH_TOOL_SCHEMA: dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": ToolName.RESEARCH_TOOL.value,
+        "description": RESEARCH_TOOL_DESCRIPTION,
+        "parameters": {
+            "properties": {"subtasks": {"items": {"type": "string"}, "type": "array"}},
+            "required": ["subtasks"],
+            "type": "object",
+        },
+    },
+}
+
+
 def create_research_tool() -> StructuredTool:
     """Create research decision tool."""
     return StructuredTool.from_function(
         name=ToolName.RESEARCH_TOOL,
-        description=(
-            "Use this tool to delegate research to a sub-agent. Provide independent subtasks "
-            "that together answer the user's question."
-        ),
+        description=RESEARCH_TOOL_DESCRIPTION,
         args_schema=ShouldResearch,
         func=research_subagent,
     )
@@ -120,16 +295,23 @@ class ToolManager:
 
     _registry: ClassVar[dict[str, StructuredTool]] = {}
     _initialized: ClassVar[bool] = False
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
-    def initialize(cls):
+    def initialize(cls, tavily_api_key: str | None = None):
         """Initialize tool registry with default tools."""
         if cls._initialized:
             return
 
-        cls._registry[ToolName.WEB_SEARCH] = create_web_search_tool()
-        cls._registry[ToolName.RESEARCH_TOOL] = create_research_tool()
-        cls._initialized = True
+        with cls._lock:
+            if cls._initialized:
+                return
+
+            cls._registry.update(
+                {name: factory(tavily_api_key) for name, factory in SEARCH_TOOL_FACTORIES.items()}
+            )
+            cls._registry[ToolName.RESEARCH_TOOL] = create_research_tool()
+            cls._initialized = True
         logger.info("ToolManager initialized")
 
     @classmethod
@@ -146,5 +328,7 @@ class ToolManager:
     @classmethod
     def clear(cls):
         """Clear registry (for testing)."""
-        cls._registry.clear()
-        cls._initialized = False
+        with cls._lock:
+            cls._registry.clear()
+            cls._initialized = False
+        clear_tavily_clients()
@@ -1,17 +1,32 @@
+import asyncio
 import pytest
+from typing import ClassVar
 from unittest.mock import Mock, patch
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
 
 from agentr import AgentR, OpenAIClient, EnvConfig
-from agentr.exceptions import ResponseError
+from agentr.cache import LLMCache, SemanticLLMCache
+from agentr.config import get_settings
+from agentr.exceptions import ResponseError, ValidationError
+from agentr.graph_utils import format_research_synthesis, parse_research_results, trim_history
+from agentr.prompts import ORCHESTRATOR_PROMPT
+from agentr.states import Source, SourceType
 from agentr.tools import ToolManager
 
 
+@pytest.fixture(autouse=True)
+def clear_tool_manager():
+    """Reset the global tool registry so tests don't depend on each other."""
+    ToolManager.clear()
+    yield
+    ToolManager.clear()
+
+
 class TestAgentRInitialization:
     """Test AgentR initialization."""
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_init_with_memory_enabled(self, mock_tool_init):
+    def test_init_with_memory_enabled(self):
         """Test initialization with memory enabled."""
         config = EnvConfig(
             api_key="test-key",
@@ -27,8 +42,7 @@ class TestAgentRInitialization:
         assert agent.thread_id == "test-123"
         assert agent.memory_saver is not None
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_init_with_memory_disabled(self, mock_tool_init):
+    def test_init_with_memory_disabled(self):
         """Test initialization with memory disabled."""
         config = EnvConfig(
             api_key="test-key",
@@ -47,8 +61,7 @@ class TestAgentRInitialization:
 class TestAgentRInvoke:
     """Test AgentR invoke method."""
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_invoke_returns_response(self, mock_tool_init):
+    def test_invoke_returns_response(self):
         """Test invoke returns agent response."""
         config = EnvConfig(
             api_key="test-key",
@@ -68,8 +81,7 @@ class TestAgentRInvoke:
         assert result == "Test answer"
         agent.graph.invoke.assert_called_once()
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_invoke_raises_error_on_empty_response(self, mock_tool_init):
+    def test_invoke_raises_error_on_empty_response(self):
         """Test invoke raises ResponseError on empty response."""
         config = EnvConfig(
             api_key="test-key",
@@ -87,12 +99,56 @@ class TestAgentRInvoke:
         with pytest.raises(ResponseError):
             agent.invoke("Test question")
 
+    def test_invoke_with_thread_id_reuses_graph(self):
+        """Test invoke targets another thread without rebuilding the graph."""
+        config = EnvConfig(
+            api_key="test-key",
+            api_url="https://test.com",
+            model_name="test-model",
+            tavily_api_key="test-tavily",
+        )  # type: ignore
+
+        client = Mock(spec=OpenAIClient)
+        agent = AgentR(client, config, enable_memory=True, thread_id="main")
+
+        agent.graph = Mock()
+        agent.graph.invoke = Mock(return_value={"response": "Test answer"})
+
+        agent.invoke("Test question", thread_id="other")
+
+        run_config = agent.graph.invoke.call_args.args[1]
+        assert run_config["configurable"]["thread_id"] == "other"
+        assert agent.config["configurable"]["thread_id"] == "main"
+
+    def test_agents_use_their_own_tavily_key(self):
+        """Test each agent's search tools are bound to its own Tavily key."""
+        agents = [
+            AgentR(
+                Mock(spec=OpenAIClient),
+                EnvConfig(
+                    api_key="test-key",
+                    api_url="https://test.com",
+                    model_name="test-model",
+                    tavily_api_key=tavily_api_key,
+                ),  # type: ignore
+                enable_memory=False,
+            )
+            for tavily_api_key in ("tavily-a", "tavily-b")
+        ]
+
+        with patch("agentr.tools.web_search_sync", return_value=[]) as mock_search:
+            for agent in agents:
+                tools = agent.graph.nodes["tool_node"].bound.tools_by_name
+                tools["web_search"].invoke({"query": "test"})
+
+        api_keys = [call.kwargs["api_key"] for call in mock_search.call_args_list]
+        assert api_keys == ["tavily-a", "tavily-b"]
+
 
 class TestAgentRMemory:
     """Test AgentR memory features."""
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_get_state_with_memory_enabled(self, mock_tool_init):
+    def test_get_state_with_memory_enabled(self):
         """Test getting state with memory enabled."""
         config = EnvConfig(
             api_key="test-key",
@@ -113,8 +169,7 @@ class TestAgentRMemory:
         assert "message_history" in state
         assert len(state["message_history"]) == 1
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_get_state_with_memory_disabled(self, mock_tool_init):
+    def test_get_state_with_memory_disabled(self):
         """Test getting state with memory disabled."""
         config = EnvConfig(
             api_key="test-key",
@@ -130,8 +185,7 @@ class TestAgentRMemory:
 
         assert state == {}
 
-    @patch("agentr.agent.ToolManager.initialize")
-    def test_clear_memory(self, mock_tool_init):
+    def test_clear_memory(self):
         """Test clearing memory."""
         config = EnvConfig(
             api_key="test-key",
@@ -168,6 +222,288 @@ class TestOpenAIClient:
         assert client.api_key == "test-key"
         assert client.model == "test-model"
 
+    @patch("agentr.client.ChatOpenAI")
+    def test_structured_output_reuses_tool_binding(self, mock_chat_openai):
+        """Test tools are bound once per tool set."""
+        client = OpenAIClient(model="test-model", api_key="test-key")
+        tool = Mock()
+        tool.name = "web_search"
+        messages = [HumanMessage(content="test")]
+
+        client.with_structured_output(messages=messages, tools=[tool])
+        client.with_structured_output(messages=messages, tools=[tool])
+
+        assert mock_chat_openai.return_value.bind_tools.call_count == 1
+
+        client.clear_cache()
+        client.with_structured_output(messages=messages, tools=[tool])
+
+        assert mock_chat_openai.return_value.bind_tools.call_count == 2
+
+    def test_unmarshal_response_splits_results(self):
+        """Test marshaled results are split per task, in task order."""
+        in_order = AIMessage(content="### Result 1\nfirst\n\n### Result 2\nsecond\n")
+        out_of_order = AIMessage(content="### Result 2\nsecond\n### Result 1\nfirst")
+
+        assert OpenAIClient._unmarshal_response(in_order, 2) == ["first", "second"]
+        assert OpenAIClient._unmarshal_response(out_of_order, 2) == ["first", "second"]
+
+        with pytest.raises(ResponseError):
+            OpenAIClient._unmarshal_response(AIMessage(content="### Result 1\nfirst"), 2)
+
+    @patch("agentr.client.ChatOpenAI")
+    def test_chat_marshaled_groups_by_row_count(self, mock_chat_openai):
+        """Test prompts are packed into requests of at most row_count tasks."""
+        from langchain_core.messages import SystemMessage
+
+        client = OpenAIClient(model="test-model", api_key="test-key")
+
+        def answer(batch):
+            responses = []
+            for _, request in batch:
+                count = request.content.count("### Task")
+                results = [f"### Result {i}\nanswer to task {i}" for i in range(count, 0, -1)]
+                responses.append(AIMessage(content="\n".join(results)))
+            return responses
+
+        client.batch_chat = Mock(side_effect=answer)
+        prompts = [f"prompt {i}" for i in range(5)]
+
+        answers = client.chat_marshaled(SystemMessage(content="system"), prompts, row_count=2)
+
+        batch = client.batch_chat.call_args.args[0]
+        assert [request.content.count("### Task") for _, request in batch] == [2, 2, 1]
+        assert "### Task 1\nprompt 4" in batch[2][1].content
+        assert answers == [f"answer to task {i}" for i in (1, 2, 1, 2, 1)]
+
+    def test_chat_many_preserves_order(self):
+        """Test answers come back in input order and a failing conversation raises."""
+        from langchain_core.messages import SystemMessage
+        from langchain_core.runnables import RunnableLambda
+
+        async def answer(messages):
+            system, question = messages
+            if question.content == "fail":
+                raise ResponseError("boom")
+            # Later questions finish first.
+            await asyncio.sleep(0.01 * (3 - int(question.content)))
+            return AIMessage(content=f"{system.content}: {question.content}")
+
+        client = OpenAIClient(model="test-model", api_key="test-key")
+        client.client = RunnableLambda(answer)
+        system = SystemMessage(content="system")
+        batches = [[HumanMessage(content=str(i))] for i in range(3)]
+
+        responses = asyncio.run(client.chat_many(system, batches, max_concurrency=3))
+
+        assert [response.content for response in responses] == [f"system: {i}" for i in range(3)]
+        with pytest.raises(ResponseError):
+            asyncio.run(client.chat_many(system, [*batches, [HumanMessage(content="fail")]]))
+
+    @patch("agentr.client.ChatOpenAI")
+    def test_submit_batch_uploads_jsonl(self, mock_chat_openai):
+        """Test each conversation becomes one chat-completions line in the batch file."""
+        import json
+
+        from langchain_core.messages import SystemMessage
+
+        root_client = mock_chat_openai.return_value.root_client
+        root_client.files.create.return_value.id = "file-1"
+        root_client.batches.create.return_value.id = "batch-1"
+        client = OpenAIClient(model="test-model", api_key="test-key")
+
+        batch_id = client.submit_batch(
+            [[SystemMessage(content="system"), HumanMessage(content="a")], [HumanMessage("b")]]
+        )
+
+        _, body = root_client.files.create.call_args.kwargs["file"]
+        lines = [json.loads(line) for line in body.decode().splitlines()]
+        assert batch_id == "batch-1"
+        assert [line["custom_id"] for line in lines] == ["0", "1"]
+        assert lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"] == {
+            "model": "test-model",
+            "messages": [
+                {"role": "system", "content": "system"},
+                {"role": "user", "content": "a"},
+            ],
+        }
+        assert root_client.batches.create.call_args.kwargs["input_file_id"] == "file-1"
+
+    @patch("agentr.client.ChatOpenAI")
+    def test_poll_batch_statuses(self, mock_chat_openai):
+        """Test running batches return None and failed batches raise."""
+        job = mock_chat_openai.return_value.root_client.batches.retrieve.return_value
+        client = OpenAIClient(model="test-model", api_key="test-key")
+
+        job.status = "in_progress"
+        assert client.poll_batch("batch-1") is None
+
+        job.status = "failed"
+        with pytest.raises(ResponseError):
+            client.poll_batch("batch-1")
+
+        job.status = "completed"
+        job.request_counts.failed = 1
+        with pytest.raises(ResponseError):
+            client.poll_batch("batch-1")
+
+    @patch("agentr.client.ChatOpenAI")
+    def test_poll_batch_returns_messages_in_order(self, mock_chat_openai):
+        """Test completed batch results are ordered by custom_id and keep tool calls and usage."""
+        import json
+
+        root_client = mock_chat_openai.return_value.root_client
+        job = root_client.batches.retrieve.return_value
+        job.status = "completed"
+        job.request_counts.failed = 0
+        usage = {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+        tool_call = {
+            "id": "call-1",
+            "type": "function",
+            "function": {"name": "web_search", "arguments": '{"query": "q"}'},
+        }
+        messages = {
+            "1": {"role": "assistant", "content": None, "tool_calls": [tool_call]},
+            "0": {"role": "assistant", "content": "answer"},
+        }
+        root_client.files.content.return_value.text = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": message}], "usage": usage},
+                    },
+                }
+            )
+            for custom_id, message in messages.items()
+        )
+        client = OpenAIClient(model="test-model", api_key="test-key")
+
+        first, second = client.poll_batch("batch-1")
+
+        assert first.content == "answer"
+        assert second.content == ""
+        assert second.tool_calls[0]["name"] == "web_search"
+        assert second.tool_calls[0]["args"] == {"query": "q"}
+        assert second.usage_metadata == {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5}
+
+    def test_close_only_releases_owned_http_pools(self):
+        """Test closing a client leaves shared and injected pools open."""
+        import httpx
+
+        first = OpenAIClient(model="test-model", api_key="test-key")
+        second = OpenAIClient(model="test-model", api_key="test-key")
+        injected = httpx.Client()
+        owner = OpenAIClient(
+            model="test-model", api_key="test-key", http_client=injected, share_http_pool=False
+        )
+        mixed = OpenAIClient(model="test-model", api_key="test-key", http_client=injected)
+
+        first.close()
+        mixed.close()
+        asyncio.run(owner.aclose())
+
+        assert first.http_client is second.http_client
+        assert not second.http_client.is_closed
+        assert not second.http_async_client.is_closed
+        assert not injected.is_closed
+        assert owner.http_async_client.is_closed
+        injected.close()
+
+
+class TestLLMCache:
+    """Test LLM response cache."""
+
+    def test_lookup_counts_hits_and_misses(self):
+        """Test cache lookups are counted."""
+        cache = LLMCache()
+        generation = ChatGeneration(
+            message=AIMessage(
+                content="cached",
+                usage_metadata={"input_tokens": 8, "output_tokens": 2, "total_tokens": 10},
+            )
+        )
+
+        assert cache.lookup("prompt", "llm") is None
+        cache.update("prompt", "llm", [generation])
+
+        assert cache.lookup("prompt", "llm") == [generation]
+        assert cache.stats() == {"hits": 1, "misses": 1, "tokens_saved": 10}
+
+    @staticmethod
+    def _semantic_cache():
+        """Build a semantic cache with a bag-of-words embedding."""
+        import re
+
+        vocabulary = ["what", "is", "the", "capital", "of", "france", "spain"]
+        embeddings = Mock()
+        embeddings.embed_query = lambda text: [
+            float(re.findall(r"\w+", text.lower()).count(word)) for word in vocabulary
+        ]
+        return SemanticLLMCache(embeddings, system_prompt=ORCHESTRATOR_PROMPT)
+
+    @staticmethod
+    def _route():
+        """Build a cached orchestrator response that delegates research."""
+        tool_call = {"name": "research_sub_agent", "args": {"subtasks": ["x"]}, "id": "call_1"}
+        return ChatGeneration(message=AIMessage(content="", tool_calls=[tool_call]))
+
+    @staticmethod
+    def _prompt(*messages):
+        """Serialize messages the way chat models build cache keys."""
+        from langchain_core.load import dumps
+
+        return dumps(list(messages))
+
+    def test_semantic_lookup_matches_same_question(self):
+        """Test a rephrased first-turn question hits the semantic cache."""
+        from langchain_core.messages import SystemMessage
+
+        cache = self._semantic_cache()
+        generation = self._route()
+        system = SystemMessage(content=ORCHESTRATOR_PROMPT)
+
+        question = HumanMessage("What is the capital of France?")
+        cache.update(self._prompt(system, question, SystemMessage("12:00")), "llm", [generation])
+
+        prompt = self._prompt(
+            system, HumanMessage("what is the capital of france"), SystemMessage("12:01")
+        )
+        assert cache.lookup(prompt, "llm") == [generation]
+        assert cache.lookup(prompt, "other-llm") is None
+
+    def test_semantic_lookup_keeps_different_questions_apart(self):
+        """Test prompts sharing the system prefix but asking other questions don't collide."""
+        from langchain_core.messages import SystemMessage
+
+        cache = self._semantic_cache()
+        system = SystemMessage(content=ORCHESTRATOR_PROMPT)
+        question = HumanMessage("What is the capital of France?")
+        cache.update(self._prompt(system, question), "llm", [self._route()])
+
+        other_question = self._prompt(system, HumanMessage("What is the capital of Spain?"))
+        researcher = self._prompt(SystemMessage(content="researcher"), question)
+        later_turn = self._prompt(system, HumanMessage("hi"), AIMessage("hello"), question)
+
+        assert cache.lookup(other_question, "llm") is None
+        assert cache.lookup(researcher, "llm") is None
+        assert cache.lookup(later_turn, "llm") is None
+
+    def test_semantic_lookup_skips_direct_answers(self):
+        """Test direct answers are only served for the exact prompt, current time included."""
+        from langchain_core.messages import SystemMessage
+
+        cache = self._semantic_cache()
+        generation = ChatGeneration(message=AIMessage(content="Paris"))
+        system = SystemMessage(content=ORCHESTRATOR_PROMPT)
+        question = HumanMessage("What is the capital of France?")
+        cache.update(self._prompt(system, question, SystemMessage("12:00")), "llm", [generation])
+
+        assert cache.lookup(self._prompt(system, question, SystemMessage("12:00")), "llm")
+        assert cache.lookup(self._prompt(system, question, SystemMessage("12:01")), "llm") is None
+
 
 class TestTools:
     """Test tool functionality."""
@@ -192,6 +528,228 @@ class TestTools:
         assert tool is not None
         assert tool.name == "web_search"
 
+    def test_research_tool_schema_matches_tool(self):
+        """Test the hand-written research schema matches the generated one."""
+        from langchain_core.utils.function_calling import convert_to_openai_tool
+
+        from agentr.tools import RESEARCH_TOOL_SCHEMA, create_research_tool
+
+        assert RESEARCH_TOOL_SCHEMA == convert_to_openai_tool(create_research_tool())
+
+    def test_should_research_dedupes_and_caps_subtasks(self):
+        """Test planned subtasks are cleaned up before research."""
+        from agentr.tools import MAX_SUBTASKS, ShouldResearch
+
+        plan = ShouldResearch(subtasks=["a", " a ", "", "b"])
+        assert plan.subtasks == ["a", "b"]
+
+        plan = ShouldResearch(subtasks=[f"task {i}" for i in range(MAX_SUBTASKS + 3)])
+        assert len(plan.subtasks) == MAX_SUBTASKS
+
+        with pytest.raises(ValueError):
+            ShouldResearch(subtasks=["", "  "])
+
+    @patch("agentr.tools._get_async_tavily_client")
+    def test_batch_web_search_merges_results(self, mock_get_client):
+        """Test batch search merges results and skips failed queries."""
+        from agentr.tools import batch_web_search_async
+
+        async def search(query):
+            if query == "bad":
+                raise RuntimeError("search failed")
+            return {"results": [{"url": f"https://{query}.com", "content": query}]}
+
+        mock_get_client.return_value.search = search
+
+        sources = asyncio.run(batch_web_search_async(["a", "bad", "b"], api_key="test"))
+
+        assert [source["source"] for source in sources] == ["https://a.com", "https://b.com"]
+        assert mock_get_client.call_count == 1
+
+    @patch("agentr.tools._get_tavily_client")
+    def test_sync_batch_web_search_skips_failures(self, mock_get_client):
+        """Test sync batch search skips failed and cancelled queries like the async path."""
+        from agentr.tools import _merge_batch_responses, batch_web_search_sync
+
+        def search(query):
+            if query == "bad":
+                raise RuntimeError("search failed")
+            return {"results": [{"url": f"https://{query}.com", "content": query}]}
+
+        mock_get_client.return_value.search = search
+
+        sources = batch_web_search_sync(["a", "bad", "b"], api_key="test")
+
+        assert [source["source"] for source in sources] == ["https://a.com", "https://b.com"]
+
+        response = {"results": [{"url": "https://a.com", "content": "a"}]}
+        sources = _merge_batch_responses(["x", "a"], [asyncio.CancelledError(), response])
+        assert [source["source"] for source in sources] == ["https://a.com"]
+
+
+class TestGraphUtils:
+    """Test graph utility helpers."""
+
+    def test_format_research_synthesis(self):
+        """Test sources are numbered and separated by blank lines."""
+        findings = [
+            Source(source="https://a.com", content="first", type=SourceType.WEB),
+            Source(source="https://b.com", content="second", type=SourceType.WEB),
+        ]
+
+        synthesis = format_research_synthesis(findings)
+
+        assert "Total Sources: 2" in synthesis
+        assert "Content: first\n\n[Source 2]\n" in synthesis
+        assert synthesis.endswith("Content: second\n\n\n---\nStatus: Complete")
+
+    def test_trim_history_starts_on_human_turn(self):
+        """Test history is bounded without splitting a turn."""
+        history = []
+        for i in range(5):
+            history += [HumanMessage(content=f"q{i}"), AIMessage(content=f"a{i}")]
+
+        trimmed = trim_history(history, 5)
+
+        assert [message.content for message in trimmed] == ["q3", "a3", "q4", "a4"]
+        assert trim_history(history, None) is history
+
+    def test_parse_research_results(self):
+        """Test research results are validated into sources."""
+        results = '[{"source": "https://a.com", "content": "a", "type": "web"}]'
+        sources = parse_research_results(results)
+
+        assert sources == [Source(source="https://a.com", content="a", type=SourceType.WEB)]
+
+        with pytest.raises(ValidationError):
+            parse_research_results('[{"source": "https://a.com", "type": "video"}]')
+
+
+class TestNodes:
+    """Test graph nodes."""
+
+    LIST_CONTENT: ClassVar[list[dict]] = [
+        {"type": "text", "text": "Hello "},
+        {"type": "text", "text": "world"},
+    ]
+
+    def test_orchestrator_accepts_list_content(self):
+        """Test a direct answer made of content blocks is joined into text."""
+        from agentr.nodes import OrchestratorNode
+
+        client = Mock(spec=OpenAIClient)
+        client.with_structured_output.return_value = AIMessage(content=self.LIST_CONTENT)
+
+        state = OrchestratorNode(client)(
+            {"message_history": [HumanMessage(content="hi")]}, {"configurable": {}}
+        )
+
+        assert state["response"] == "Hello world"
+
+    def test_orchestrator_answers_directly_without_subtasks(self):
+        """Test research delegated with only blank subtasks falls back to a direct answer."""
+        from agentr.nodes import OrchestratorNode
+
+        tool_call = {"name": "research_sub_agent", "args": {"subtasks": [" "]}, "id": "call_1"}
+        client = Mock(spec=OpenAIClient)
+        client.with_structured_output.return_value = AIMessage(content="", tool_calls=[tool_call])
+        client.chat.return_value = AIMessage(content="Direct answer")
+
+        state = OrchestratorNode(client)(
+            {"message_history": [HumanMessage(content="hi")]}, {"configurable": {}}
+        )
+
+        assert state["should_delegate"] is False
+        assert state["response"] == "Direct answer"
+
+    def test_researcher_accepts_list_content(self):
+        """Test final research made of content blocks reaches the orchestrator as text."""
+        from agentr.nodes import Researcher
+
+        client = Mock(spec=OpenAIClient)
+        client.with_structured_output.return_value = AIMessage(content=self.LIST_CONTENT)
+        state = {"current_iteration": 1, "sub_agent_call_id": "call-1", "researcher_history": []}
+
+        result = Researcher(client, tools=[])(state, {"configurable": {"max_iterations": 4}})
+
+        assert result["message_history"][0].content == "Hello world"
+
+    def test_max_iterations_synthesis_drops_duplicate_sources(self):
+        """Test a source returned by two searches appears once in the synthesis."""
+        from langchain_core.messages import ToolMessage
+
+        from agentr.nodes import Researcher
+
+        shared = Source(source="https://a.com", content="shared", type=SourceType.WEB)
+        other = Source(source="https://b.com", content="other", type=SourceType.WEB)
+        history = [
+            HumanMessage(content="[]"),
+            ToolMessage(content="", tool_call_id="1", artifact=[shared, other]),
+            ToolMessage(content="", tool_call_id="2", artifact=[dict(shared)]),
+        ]
+        state = {
+            "current_iteration": 5,
+            "sub_agent_call_id": "call-1",
+            "researcher_history": history,
+        }
+
+        result = Researcher(Mock(spec=OpenAIClient), tools=[])(
+            state, {"configurable": {"max_iterations": 4}}
+        )
+
+        synthesis = result["message_history"][0].content
+        assert synthesis.count("Source: https://a.com") == 1
+        assert "Total Sources: 2" in synthesis
+
+    def test_answer_buffer_accepts_list_content(self):
+        """Test streamed orchestrator chunks made of content blocks are yielded as text."""
+        from langchain_core.messages import AIMessageChunk
+
+        from agentr.agent import _AnswerBuffer
+
+        chunk = AIMessageChunk(content=[{"type": "text", "text": "Hel", "index": 0}])
+        answer = _AnswerBuffer()
+        answer.add((chunk, {"langgraph_node": "orchestrator"}))
+        answer.add((chunk, {"langgraph_node": "researcher"}))
+
+        assert answer.flush() == "Hel"
+
+    def test_answer_buffer_drops_tool_call_preamble(self):
+        """Test text sent along with the research tool call is not streamed as the answer."""
+        from langchain_core.messages import AIMessageChunk
+
+        from agentr.agent import _AnswerBuffer
+
+        orchestrator = {"langgraph_node": "orchestrator"}
+        tool_call = {"name": "research_sub_agent", "args": "{}", "id": "call_1", "index": 0}
+        answer = _AnswerBuffer()
+        answer.add((AIMessageChunk(content="Let me look that up. "), orchestrator))
+        answer.add((AIMessageChunk(content="", tool_call_chunks=[tool_call]), orchestrator))
+
+        assert answer.flush() == ""
+
+        answer.add((AIMessageChunk(content="Paris"), orchestrator))
+        assert answer.flush() == "Paris"
+
+
+class TestConfig:
+    """Test configuration loading."""
+
+    def test_get_settings_returns_cached_instance(self):
+        """Test repeated get_settings calls reuse the same instance."""
+        overrides = {
+            "api_key": "test-key",
+            "api_url": "https://test.com",
+            "model_name": "test-model",
+            "tavily_api_key": "test-tavily",
+        }
+
+        first = get_settings(**overrides)
+        second = get_settings(**overrides)
+
+        assert first is second
+        assert first.model_name == "test-model"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])